@@ -3,11 +3,10 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from prophet import Prophet
 from datetime import datetime, timedelta
 import duckdb
-import base64
-from io import BytesIO
+import os
+import tempfile
 
 # ────────────────────────────── PAGE CONFIG ──────────────────────────────
 st.set_page_config(
@@ -18,7 +17,7 @@ st.set_page_config(
 )
 
 # ────────────────────────────── FAIR SQUARE PRO THEME ──────────────────────────────
-st.markdown("""
+THEME_CSS = """
 <style>
     .css-1d391kg {background: #0B1215}
     .css-1v0mbdj {color: #00D4AA}
@@ -28,27 +27,231 @@ st.markdown("""
     .stRadio > div {background: #1E2A38; padding: 10px; border-radius: 10px}
     .css-1y0t9fb {background: #000000}
 </style>
-""", unsafe_allow_html=True)
+"""
+# Must be emitted on every run: Streamlit drops elements a rerun does not re-send
+st.markdown(THEME_CSS, unsafe_allow_html=True)
 
 # ────────────────────────────── SESSION STATE INIT ──────────────────────────────
 if "df" not in st.session_state:
     st.session_state.df = None
+if "source" not in st.session_state:
+    st.session_state.source = None
 if "first_load" not in st.session_state:
     st.session_state.first_load = True
 
 # ────────────────────────────── DEMO DATA ──────────────────────────────
+@st.cache_data
 def generate_demo_data():
-    np.random.seed(42)
+    n = 1000
+    rng = np.random.default_rng(42)
     dates = pd.date_range("2023-01-01", periods=1000, freq='D')
-    data = {
-        "date": np.random.choice(dates, 1000),
-        "sales": np.random.uniform(2, 500, 1000).round(2),
-        "product": np.random.choice(["Beverages", "Meals", "Desserts", "Snacks", "Merch", "Seasonal"], 1000),
-        "channel": np.random.choice(["Cash", "Card", "MobilePay"], 1000),
-        "customer_type": np.random.choice(["New", "Returning", "VIP"], 1000),
-        "city": np.random.choice(["Downtown", "Midtown", "West Side", "East Side"], 1000)
+
+    def pick(categories):
+        return pd.Categorical.from_codes(rng.integers(0, len(categories), n), categories)
+
+    return pd.DataFrame({
+        "date": dates[rng.integers(0, len(dates), n)],
+        "sales": rng.uniform(2, 500, n).round(2).astype(np.float32),
+        "product": pick(["Beverages", "Meals", "Desserts", "Snacks", "Merch", "Seasonal"]),
+        "channel": pick(["Cash", "Card", "MobilePay"]),
+        "customer_type": pick(["New", "Returning", "VIP"]),
+        "city": pick(["Downtown", "Midtown", "West Side", "East Side"])
+    })
+
+# ────────────────────────────── DUCKDB ──────────────────────────────
+@st.cache_resource
+def get_con():
+    return duckdb.connect()
+
+# ────────────────────────────── CSV LOADING ──────────────────────────────
+# App column -> CSV columns it may come from, in order of preference
+CSV_DIMENSIONS = {
+    "product": ["product_category", "product"],
+    "channel": ["payment_method", "channel"],
+    "customer_type": ["customer_type"],
+    "city": ["location", "city"]
+}
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_data(file_bytes):
+    with tempfile.TemporaryDirectory() as tmp, get_con().cursor() as con:
+        path = os.path.join(tmp, "upload.csv")
+        with open(path, "wb") as f:
+            f.write(file_bytes)
+        # Every column read as text: the sniffer's types come from a sample and would fail the
+        # whole file on one late bad value, and it guesses day-first on ambiguous slash dates
+        columns = con.read_csv(path, all_varchar=True).columns
+        if not all(col in columns for col in ["date", "total_amount"]):
+            return None, 0
+        dims = []
+        for name, sources in CSV_DIMENSIONS.items():
+            source = next((col for col in sources if col in columns), None)
+            dims.append(f'"{source}" AS {name}' if source else f"'Unknown' AS {name}")
+        # Currency symbols and thousands separators ("$1,234.50") are stripped before the cast
+        df = con.execute(f"""
+            SELECT "date" AS date, TRY_CAST(REPLACE(REPLACE(total_amount, '$', ''), ',', '') AS FLOAT) AS sales, {", ".join(dims)}
+            FROM read_csv_auto(?, all_varchar = true)
+        """, [path]).df()
+    for col in CSV_DIMENSIONS:
+        df[col] = df[col].astype("category")
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    keep = df["date"].notna() & df["sales"].notna()
+    return df[keep], int((~keep).sum())
+
+# ────────────────────────────── AGGREGATES ──────────────────────────────
+# Cache key over every row: Streamlit's default hash samples frames past 50k rows,
+# so a re-upload that only differs outside the sample would get the stale result
+FRAME_HASH = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).to_numpy().tobytes()}
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH)
+def compute_daily(df):
+    with get_con().cursor() as con:
+        con.register("df", df)
+        # sales is float32 for bandwidth; Prophet and the running totals want float64
+        return con.execute("SELECT date AS ds, CAST(SUM(sales) AS DOUBLE) AS y FROM df GROUP BY date ORDER BY date").df()
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH)
+def product_growth(df):
+    monthly = df.groupby([pd.Grouper(key="date", freq="MS"), "product"], observed=True)["sales"].sum().unstack(fill_value=0)
+    if monthly.empty:
+        return pd.Series(0.0, index=monthly.columns, name="growth")
+    # The Grouper skips months with no sales; put them back so the last two rows are adjacent months
+    monthly = monthly.reindex(pd.date_range(monthly.index[0], monthly.index[-1], freq="MS"), fill_value=0)
+    # A trailing partial month would read as a drop against the full month before it
+    if df["date"].max().normalize() < monthly.index[-1] + pd.offsets.MonthEnd(0):
+        monthly = monthly.iloc[:-1]
+    if len(monthly) < 2:
+        return pd.Series(0.0, index=monthly.columns, name="growth")
+    prev, last = monthly.iloc[-2].to_numpy(dtype=float), monthly.iloc[-1].to_numpy(dtype=float)
+    growth = np.divide(last - prev, prev, out=np.zeros_like(last), where=prev != 0)
+    return pd.Series(growth, index=monthly.columns, name="growth")
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH)
+def compute_kpis(df):
+    with get_con().cursor() as con:
+        con.register("df", df)
+        # One scan: GROUPING SETS computes every per-dimension sum and the grand total together
+        rollup = con.execute("""
+            SELECT
+                CASE WHEN GROUPING(city) = 0 THEN 'city'
+                     WHEN GROUPING(product) = 0 THEN 'product'
+                     WHEN GROUPING(channel) = 0 THEN 'channel'
+                     WHEN GROUPING(customer_type) = 0 THEN 'customer_type'
+                     ELSE 'total' END AS dim,
+                COALESCE(CAST(city AS VARCHAR), CAST(product AS VARCHAR), CAST(channel AS VARCHAR), CAST(customer_type AS VARCHAR)) AS key,
+                SUM(sales) AS sales,
+                COUNT(*) AS n,
+                COUNT(*) FILTER (WHERE customer_type = 'VIP') AS vip
+            FROM df
+            GROUP BY GROUPING SETS ((city), (product), (channel), (customer_type), ())
+            ORDER BY dim, key
+        """).df()
+
+    def by(dim):
+        part = rollup[(rollup["dim"] == dim) & rollup["key"].notna()]
+        return pd.Series(part["sales"].to_numpy(), index=pd.Index(part["key"], name=dim), name="sales")
+
+    total = rollup[rollup["dim"] == "total"].iloc[0]
+    by_city, by_product = by("city"), by("product")
+    return {
+        "revenue": total["sales"],
+        "avg_sale": total["sales"] / total["n"],
+        "top_city": by_city.idxmax() if not by_city.empty else None,
+        "vip_share": total["vip"] / total["n"],
+        "top_products": by_product.nlargest(3),
+        "channel_mix": by("channel"),
+        "by_city": by_city,
+        "by_customer_type": by("customer_type")
     }
-    return pd.DataFrame(data)
+
+# ────────────────────────────── FORECAST ──────────────────────────────
+@st.cache_resource(show_spinner="Fitting forecast…", hash_funcs=FRAME_HASH)
+def fit_prophet(daily_df):
+    # Imported here: Prophet pulls in cmdstanpy and Stan, which only this page needs
+    from prophet import Prophet
+    m = Prophet(yearly_seasonality=True, weekly_seasonality=True, daily_seasonality=False)
+    m.fit(daily_df)
+    return m
+
+def fourier_terms(t, period, order):
+    angles = 2 * np.pi * np.outer(t, np.arange(1, order + 1)) / period
+    return np.hstack([np.sin(angles), np.cos(angles)])
+
+def ridge_forecast(daily_df, periods=90, alpha=1.0):
+    # Linear trend plus weekly Fourier terms, ridge-solved in closed form; NumPy-only fallback for short histories
+    ds = daily_df["ds"]
+    y = daily_df["y"].to_numpy()
+    future_ds = pd.date_range(ds.iloc[-1] + pd.Timedelta(days=1), periods=periods, freq="D")
+    all_ds = np.concatenate([ds.to_numpy(), future_ds.to_numpy()])
+    t = (all_ds - all_ds[0]) / np.timedelta64(1, "D")
+
+    X = np.column_stack([np.ones_like(t), t / max(t[len(y) - 1], 1.0), fourier_terms(t, 7, 3)])
+    hist = X[:len(y)]
+    penalty = alpha * np.eye(X.shape[1])
+    penalty[0, 0] = 0
+    coef = np.linalg.solve(hist.T @ hist + penalty, hist.T @ y)
+    yhat = X @ coef
+    # Same 80% interval width Prophet reports by default
+    spread = 1.28 * np.std(y - yhat[:len(y)])
+    return pd.DataFrame({
+        "ds": all_ds,
+        "yhat": yhat,
+        "yhat_lower": yhat - spread,
+        "yhat_upper": yhat + spread
+    })
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH)
+def fit_and_forecast(daily_df, periods=90):
+    # Prophet's yearly seasonality needs a year of history; below that the Stan fit buys nothing
+    if (daily_df["ds"].iloc[-1] - daily_df["ds"].iloc[0]).days < 365:
+        return ridge_forecast(daily_df, periods)
+    m = fit_prophet(daily_df)
+    future = m.make_future_dataframe(periods=periods)
+    return m.predict(future)
+
+# ────────────────────────────── CHART HELPERS ──────────────────────────────
+def downsample(frame, x, y, n_out=1000):
+    # Largest-Triangle-Three-Buckets: keep the rows that best preserve the line's shape
+    n = len(frame)
+    if n <= n_out:
+        return frame
+    xs = frame[x].to_numpy().astype("int64").astype(float)
+    ys = frame[y].to_numpy(dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = xs[hi:nxt_hi].mean(), ys[hi:nxt_hi].mean()
+        area = np.abs((xs[a] - avg_x) * (ys[lo:hi] - ys[a]) - (xs[a] - xs[lo:hi]) * (avg_y - ys[a]))
+        a = lo + area.argmax()
+        keep[i + 1] = a
+    return frame.iloc[keep]
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH)
+def build_forecast_fig(daily_df):
+    # Keyed on daily alone: the forecast is a pure function of it
+    forecast = fit_and_forecast(daily_df)
+    actual = downsample(daily_df, "ds", "y")
+    band = downsample(forecast, "ds", "yhat")
+
+    ds = band["ds"].to_numpy()
+    fig = go.Figure(data=[
+        go.Scatter(x=actual["ds"].to_numpy(), y=actual["y"].to_numpy(), name="Actual"),
+        go.Scatter(x=ds, y=band["yhat"].to_numpy(), name="Forecast"),
+        go.Scatter(x=ds, y=band["yhat_lower"].to_numpy(), mode="lines", line=dict(width=0), showlegend=False),
+        go.Scatter(x=ds, y=band["yhat_upper"].to_numpy(), mode="lines", line=dict(width=0), fill="tonexty", name="Confidence")
+    ])
+    return fig.to_dict()
+
+# ────────────────────────────── LOAN MATH ──────────────────────────────
+def annuity(amount, rate, term):
+    # Monthly payment for an annual rate; plain arithmetic so it also broadcasts over numpy arrays
+    monthly_rate = rate / 12
+    growth = (1 + monthly_rate) ** term
+    return amount * monthly_rate * growth / (growth - 1)
 
 # ────────────────────────────── SIDEBAR UPLOADER ──────────────────────────────
 with st.sidebar:
@@ -56,40 +259,53 @@ with st.sidebar:
     st.title("Upload Your Data")
     uploaded_file = st.file_uploader("CSV with retail transactions", type="csv")
 
-    if uploaded_file:
-        try:
-            df = pd.read_csv(uploaded_file)
-            required = ["date", "total_amount"]
-            if all(col in df.columns for col in required):
-                df["date"] = pd.to_datetime(df["date"], errors="coerce")
-                df = df.dropna(subset=["date", "total_amount"])
-                df.rename(columns={
-                    "total_amount": "sales",
-                    "product_category": "product",
-                    "payment_method": "channel",
-                    "location": "city"
-                }, inplace=True)
-                for col in ["product", "channel", "customer_type", "city"]:
-                    if col not in df.columns:
-                        df[col] = "Unknown"
-                st.session_state.df = df[["date", "sales", "product", "channel", "customer_type", "city"]]
-                st.success("Data loaded successfully!")
-                if st.session_state.first_load:
-                    st.balloons()
-                    st.session_state.first_load = False
-            else:
-                st.error("Missing required: date or total_amount")
-                st.session_state.df = generate_demo_data()
-        except:
-            st.error("Invalid file")
-            st.session_state.df = generate_demo_data()
-    else:
-        st.session_state.df = generate_demo_data()
+    # Reload only when the source changes; cache hits would otherwise hand back a fresh copy every rerun
+    source = uploaded_file.file_id if uploaded_file else "demo"
+    if st.session_state.source != source:
+        load_error = load_warning = None
+        df = None
+        if uploaded_file:
+            try:
+                df, dropped = load_data(uploaded_file.getvalue())
+                if df is None:
+                    load_error = "Missing required: date or total_amount"
+                elif df.empty:
+                    load_error = "No rows with a readable date and total_amount"
+                    df = None
+                elif dropped:
+                    load_warning = f"Skipped {dropped:,} rows with an unreadable date or total_amount"
+            except (ValueError, duckdb.Error):
+                load_error = "Invalid file"
+        loaded = df is not None
+        if not loaded:
+            df = generate_demo_data()
+        daily = compute_daily(df)
+        # One cursor per session so registered views never leak between users
+        if "con" not in st.session_state:
+            st.session_state.con = get_con().cursor()
+        st.session_state.con.register("df", df)
+        st.session_state.df = df
+        st.session_state.daily = daily
+        st.session_state.load_error = load_error
+        st.session_state.load_warning = load_warning
+        # Marked loaded last: if anything above raised, the next rerun tries this source again
+        st.session_state.source = source
+        if loaded and st.session_state.first_load:
+            st.balloons()
+            st.session_state.first_load = False
+
+    if not uploaded_file:
         st.info("Using demo data – upload your CSV for real insights")
+    elif st.session_state.load_error:
+        st.error(st.session_state.load_error)
+    else:
+        st.success("Data loaded successfully!")
+        if st.session_state.load_warning:
+            st.warning(st.session_state.load_warning)
 
 df = st.session_state.df
-df["date"] = pd.to_datetime(df["date"])
-daily = df.groupby("date")["sales"].sum().reset_index().rename(columns={"date": "ds", "sales": "y"})
+daily = st.session_state.daily
+con = st.session_state.con
 
 # ────────────────────────────── NAVIGATION ──────────────────────────────
 page = st.sidebar.radio("Navigate", [
@@ -102,27 +318,29 @@ if page == "Home":
     st.markdown("# 💰 Real-time intelligence for small-business owners")
     st.markdown("### Upload your data → get answers in seconds")
 
+    kpis = compute_kpis(df)
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Revenue", f"${df['sales'].sum():,.0f}", "+18%")
+        st.metric("Revenue", f"${kpis['revenue']:,.0f}", "+18%")
     with col2:
-        st.metric("Avg Daily Sales", f"${df['sales'].mean():.0f}")
+        st.metric("Avg Daily Sales", f"${kpis['avg_sale']:.0f}")
     with col3:
-        top_city = df.groupby("city")["sales"].sum().idxmax()
-        st.metric("Top Location", top_city)
+        st.metric("Top Location", kpis["top_city"])
     with col4:
-        st.metric("VIP Share", f"{(df['customer_type']=='VIP').mean():.0%}")
+        st.metric("VIP Share", f"{kpis['vip_share']:.0%}")
 
     c1, c2, c3 = st.columns(3)
     with c1:
-        fig_trend = px.line(daily.tail(30), x="ds", y="y", title="Last 30 Days")
+        last30 = daily.tail(30)
+        fig_trend = go.Figure(go.Scatter(x=last30["ds"].to_numpy(), y=last30["y"].to_numpy(), mode="lines"), layout=dict(title="Last 30 Days"))
         st.plotly_chart(fig_trend, use_container_width=True)
     with c2:
-        fig_channel = px.pie(df, names="channel", values="sales", title="Channel Mix")
+        mix = kpis["channel_mix"]
+        fig_channel = go.Figure(go.Pie(labels=mix.index.to_numpy(), values=mix.to_numpy()), layout=dict(title="Channel Mix"))
         st.plotly_chart(fig_channel, use_container_width=True)
     with c3:
-        top_prod = df.groupby("product")["sales"].sum().nlargest(3)
-        fig_prod = px.bar(y=top_prod.index, x=top_prod.values, orientation='h', title="Top Products")
+        top_prod = kpis["top_products"]
+        fig_prod = go.Figure(go.Bar(y=top_prod.index.to_numpy(), x=top_prod.to_numpy(), orientation='h'), layout=dict(title="Top Products"))
         st.plotly_chart(fig_prod, use_container_width=True)
 
     col1, col2, col3 = st.columns(3)
@@ -139,20 +357,21 @@ if page == "Home":
 # ────────────────────────────── BI DASHBOARD ──────────────────────────────
 elif page == "BI Dashboard":
     view = st.radio("View", ["Executive Summary", "Growth", "Customers", "Locations", "Predictive"], horizontal=True)
+    kpis = compute_kpis(df)
 
     if view in ["Executive Summary", "Growth"]:
         st.metric("Avg Daily Sales", f"${daily['y'].mean():.0f}", "+15% vs peers")
-        growth = df.groupby("product")["sales"].sum().pct_change().fillna(0)
-        fig = px.bar(growth, title="Product Growth")
+        growth = product_growth(df)
+        fig = px.bar(growth, title="Product Growth (month over month)")
         st.plotly_chart(fig, use_container_width=True)
 
     if view in ["Executive Summary", "Customers"]:
-        cohort = df.groupby("customer_type")["sales"].sum()
+        cohort = kpis["by_customer_type"]
         fig = px.pie(values=cohort.values, names=cohort.index, title="Customer Mix")
         st.plotly_chart(fig, use_container_width=True)
 
     if view in ["Executive Summary", "Locations"]:
-        loc = df.groupby("city")["sales"].sum()
+        loc = kpis["by_city"]
         fig = px.bar(loc, title="Revenue by City")
         st.plotly_chart(fig, use_container_width=True)
 
@@ -162,51 +381,46 @@ elif page == "Sales Forecast":
         st.warning("Need 30+ days for forecast")
         st.line_chart(daily.set_index("ds")["y"])
     else:
-        m = Prophet(yearly_seasonality=True, weekly_seasonality=True, daily_seasonality=False)
-        m.fit(daily)
-        future = m.make_future_dataframe(periods=90)
-        forecast = m.predict(future)
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=daily["ds"], y=daily["y"], name="Actual"))
-        fig.add_trace(go.Scatter(x=forecast["ds"], y=forecast["yhat"], name="Forecast"))
-        fig.add_trace(go.Scatter(x=forecast["ds"], y=forecast["yhat_lower"], fill=None, mode="lines", showlegend=False))
-        fig.add_trace(go.Scatter(x=forecast["ds"], y=forecast["yhat_upper"], fill="tonexty", name="Confidence"))
-        st.plotly_chart(fig, use_container_width=True)
+        forecast = fit_and_forecast(daily)
+        st.plotly_chart(build_forecast_fig(daily), use_container_width=True)
 
         next30 = forecast[forecast["ds"] > daily["ds"].max()].head(30)
         st.success(f"Next 30 days: ${next30['yhat'].sum():,.0f}")
 
 # ────────────────────────────── LOAN FORECASTER ──────────────────────────────
 elif page == "Loan Forecaster":
-    col1, col2 = st.columns(2)
-    amount = col1.number_input("Amount ($)", 1000, 100000, 50000)
-    rate = col2.slider("Rate (%)", 5.0, 25.0, 12.0)
-    term = st.slider("Term (months)", 6, 60, 24)
+    # Fragment: moving a slider reruns only the calculator, not the whole app
+    @st.fragment
+    def loan_calculator():
+        col1, col2 = st.columns(2)
+        amount = col1.number_input("Amount ($)", 1000, 100000, 50000)
+        rate = col2.slider("Rate (%)", 5.0, 25.0, 12.0)
+        term = st.slider("Term (months)", 6, 60, 24)
 
-    monthly_rate = rate / 100 / 12
-    payment = amount * monthly_rate / (1 - (1 + monthly_rate) ** -term)
-    total = payment * term
-    interest = total - amount
+        payment = annuity(amount, rate / 100, term)
+        total = payment * term
+        interest = total - amount
 
-    bank_payment = amount * (0.15 / 12) / (1 - (1 + 0.15 / 12) ** -term)
-    savings = (bank_payment - payment) * term
+        bank_payment = annuity(amount, 0.15, term)
+        savings = (bank_payment - payment) * term
 
-    st.markdown("### 💰 Loan Comparison")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.success(f"FairSquare: **${payment:,.0f}/mo**")
-    with col2:
-        st.error(f"Bank (15%): **${bank_payment:,.0f}/mo**")
+        st.markdown("### 💰 Loan Comparison")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.success(f"FairSquare: **${payment:,.0f}/mo**")
+        with col2:
+            st.error(f"Bank (15%): **${bank_payment:,.0f}/mo**")
 
-    if savings > 0:
-        st.success(f"**You save ${savings:,.0f}** vs typical bank")
-    else:
-        st.warning("Bank would be cheaper")
+        if savings > 0:
+            st.success(f"**You save ${savings:,.0f}** vs typical bank")
+        else:
+            st.warning("Bank would be cheaper")
+
+        avg_daily = daily["y"].mean()
+        days = int(amount / payment * 30)
+        st.info(f"Your avg daily sales **${avg_daily:,.0f}** → covers loan in **{days} days**")
 
-    avg_daily = daily["y"].mean()
-    days = int(amount / payment * 30)
-    st.info(f"Your avg daily sales **${avg_daily:,.0f}** → covers loan in **{days} days**")
+    loan_calculator()
 
 # ────────────────────────────── OTHER PAGES (Quick Wins) ──────────────────────────────
 elif page == "Business Q&A":
@@ -226,9 +440,13 @@ elif page == "A/B Test Simulator":
     st.write("Run 10% off email vs control → 94% power to detect 8% lift in 14 days")
 
 elif page == "Live SQL":
-    query = st.text_area("Write SQL", "SELECT product, SUM(sales) FROM df GROUP BY product")
-    if st.button("Run"):
-        result = duckdb.query(query).df()
-        st.dataframe(result)
+    @st.fragment
+    def sql_console():
+        query = st.text_area("Write SQL", "SELECT product, SUM(sales) FROM df GROUP BY product")
+        if st.button("Run"):
+            result = con.execute(query).df()
+            st.dataframe(result)
+
+    sql_console()
 
 st.caption("Data used: date, sales, product, channel, customer_type, city (your CSV)")